@@ -1,3 +1,4 @@
+import sys
 from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Optional
 import aiohttp
@@ -124,14 +125,14 @@ class GitHubClient(PlatformClient):
 
                     repo = RepoInfo(
                         platform='github',
-                        username=item['owner']['login'],
+                        username=sys.intern(item['owner']['login']),
                         name=item['name'],
                         clone_url=item['clone_url'],
                         is_fork=item['fork'],
                         is_private=item['private'],
                         is_archived=item['archived'],
                         size_kb=item['size'],
-                        default_branch=item['default_branch']
+                        default_branch=sys.intern(item['default_branch'])
                     )
                     repos.append(repo)
 
@@ -214,14 +215,14 @@ class GitLabClient(PlatformClient):
 
                     repo = RepoInfo(
                         platform='gitlab',
-                        username=item['namespace']['path'],
+                        username=sys.intern(item['namespace']['path']),
                         name=item['name'],
                         clone_url=item['http_url_to_repo'],
                         is_fork=is_fork,
                         is_private=item['visibility'] != 'public',
                         is_archived=item.get('archived', False),
                         size_kb=item.get('statistics', {}).get('repository_size', 0) // 1024,
-                        default_branch=item.get('default_branch', 'main')
+                        default_branch=sys.intern(item.get('default_branch') or 'main')
                     )
                     repos.append(repo)
 
@@ -2,12 +2,13 @@ import asyncio
 import os
 from datetime import datetime
 from pathlib import Path
+from typing import Callable
 
 import aiohttp
 import click
 
 from .api_client import GitHubClient, GitLabClient
-from .config import AppConfig, DownloadConfig
+from .config import AppConfig, DownloadConfig, default_max_parallel
 from .downloader import DownloadEngine
 from .models import RepoInfo
 from .progress import ProgressPrinter
@@ -24,7 +25,8 @@ def cli() -> None:
 @click.argument('platform', type=click.Choice(['github', 'gitlab']))
 @click.argument('username')
 @click.option('--token', help='Authentication token')
-@click.option('--max-parallel', default=5, type=click.IntRange(1, 20), help='Max concurrent downloads')
+@click.option('--max-parallel', default=default_max_parallel, type=click.IntRange(1, 20),
+              show_default='3/4 of CPUs, 5-20', help='Max concurrent downloads')
 @click.option('--output-dir', type=click.Path(), default='./repos', help='Output directory')
 @click.option('--no-forks', is_flag=True, help='Exclude forked repositories')
 @click.option('--config', type=click.Path(exists=True), help='Config file path')
@@ -81,7 +83,8 @@ async def _download_from_args(
     max_parallel: int,
     output_dir: str,
     no_forks: bool,
-    verbose: bool
+    verbose: bool,
+    session_factory: Callable[[], aiohttp.ClientSession] = aiohttp.ClientSession
 ) -> None:
     """Execute download from CLI arguments."""
     from .api_client import APIError
@@ -98,7 +101,7 @@ async def _download_from_args(
         filters['forks'] = False
 
     # Create appropriate client
-    async with aiohttp.ClientSession() as session:
+    async with session_factory() as session:
         client: GitHubClient | GitLabClient
         if platform == 'github':
             client = GitHubClient(token=token, session=session)
@@ -150,67 +153,72 @@ async def _download_from_args(
         log_dir = Path.home() / ".simple-repo-downloader" / "logs"
         log_file = log_dir / f"download-{timestamp}.log"
 
-        # Create progress printer
-        printer = ProgressPrinter(log_file=log_file)
-        printer.print_start(repos, max_parallel)
-
-        # Create status tracker
-        from .dashboard import DownloadStatus, RepoStatus
-        from .models import StateEnum
-        status = DownloadStatus()
-        for repo in repos:
-            repo_id = f"{repo.platform}/{repo.username}/{repo.name}"
-            status.repos[repo_id] = RepoStatus(repo=repo, state=StateEnum.QUEUED)
-
-        # Track current repo index
-        repo_counter = [0]  # Use list for mutable counter in closure
-
-        # Create callback
-        async def status_callback(
-            repo: RepoInfo,
-            state: str,
-            progress: int,
-            error: str | None = None
-        ) -> None:
-            repo_id = f"{repo.platform}/{repo.username}/{repo.name}"
-            if repo_id in status.repos:
-                # Update status
-                state_enum = getattr(StateEnum, state.upper(), StateEnum.QUEUED)
-                status.repos[repo_id].state = state_enum
-                status.repos[repo_id].progress_pct = progress
-
-                # Print update for terminal states only
-                if state_enum in [StateEnum.COMPLETED, StateEnum.FAILED, StateEnum.UPDATED,
-                                 StateEnum.UP_TO_DATE, StateEnum.UNCOMMITTED_CHANGES, StateEnum.AHEAD]:
-                    repo_counter[0] += 1
-                    message = error if error else "Cloned successfully"
-                    printer.print_repo_update(
-                        current=repo_counter[0],
-                        total=len(repos),
-                        repo=repo,
-                        state=state_enum,
-                        message=message
-                    )
-
-        # Create engine with callback
-        engine = DownloadEngine(download_config, status_callback=status_callback)
-
-        # Run download
-        await engine.download_all(repos, token=token)
-
-        # Print summary
-        printer.print_summary(status)
+        # Create progress printer; the with block closes its log file
+        with ProgressPrinter(log_file=log_file) as printer:
+            printer.print_start(repos, max_parallel)
+
+            # Create status tracker
+            from .dashboard import DownloadStatus, RepoStatus
+            from .models import TERMINAL_STATES, StateEnum
+            status = DownloadStatus()
+            for repo in repos:
+                repo_id = f"{repo.platform}/{repo.username}/{repo.name}"
+                status.repos[repo_id] = RepoStatus(repo=repo, state=StateEnum.QUEUED)
+
+            # Track current repo index
+            repo_counter = [0]  # Use list for mutable counter in closure
+
+            # Create callback
+            async def status_callback(
+                repo: RepoInfo,
+                state: str,
+                progress: int,
+                error: str | None = None
+            ) -> None:
+                repo_id = f"{repo.platform}/{repo.username}/{repo.name}"
+                if repo_id in status.repos:
+                    # Update status
+                    state_enum = getattr(StateEnum, state.upper(), StateEnum.QUEUED)
+                    status.repos[repo_id].state = state_enum
+                    status.repos[repo_id].progress_pct = progress
+
+                    # Print update for terminal states only
+                    if state_enum in TERMINAL_STATES:
+                        repo_counter[0] += 1
+                        message = error if error else "Cloned successfully"
+                        printer.print_repo_update(
+                            current=repo_counter[0],
+                            total=len(repos),
+                            repo=repo,
+                            state=state_enum,
+                            message=message
+                        )
+
+            # Create engine with callback
+            engine = DownloadEngine(download_config, status_callback=status_callback)
+
+            # Run download
+            await engine.download_all(repos, token=token)
+
+            # Print summary
+            printer.print_summary(status)
 
         if verbose:
             click.echo(f"\nLog saved to: {log_file}")
 
 
-async def _download_from_config(app_config: AppConfig) -> None:
+async def _download_from_config(
+    app_config: AppConfig,
+    session_factory: Callable[[], aiohttp.ClientSession] = aiohttp.ClientSession
+) -> None:
     """Execute download from configuration file."""
     # Resolve all targets to normalized format with credentials
     resolved_targets = app_config.resolve_targets()
 
-    async with aiohttp.ClientSession() as session:
+    # One engine serves every target; tokens are passed per download_all call
+    engine = DownloadEngine(app_config.download)
+
+    async with session_factory() as session:
         for target in resolved_targets:
             # Create appropriate client with resolved token
             client: GitHubClient | GitLabClient
@@ -220,7 +228,7 @@ async def _download_from_config(app_config: AppConfig) -> None:
                 client = GitLabClient(token=target.token, session=session)
 
             click.echo(f"Fetching {target.platform} repositories for {target.username}...")
-            repos = await client.list_repositories(target.username, target.filters)
+            repos = await client.list_repositories(target.username, target.filters_dict)
             click.echo(f"Found {len(repos)} repositories")
 
             # Handle empty repository list
@@ -228,7 +236,6 @@ async def _download_from_config(app_config: AppConfig) -> None:
                 click.echo("No repositories to download. Skipping.")
                 continue
 
-            engine = DownloadEngine(app_config.download)
             results = await engine.download_all(repos, token=target.token)
 
             click.echo(f"✓ Downloaded: {len(results.successful)}, Issues: {len(results.issues)}")
@@ -1,12 +1,29 @@
 # src/simple_repo_downloader/config.py
 import os
 import re
+from collections.abc import Mapping
 from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
-from typing import Literal
+from typing import Any, Literal, TypeVar
 
 import yaml
-from pydantic import BaseModel, Field, ValidationInfo, field_validator
+from pydantic import BaseModel, ConfigDict, Field, ValidationInfo, field_validator
+
+try:
+    # libyaml-backed loader/dumper are much faster; fall back when PyYAML lacks them
+    from yaml import CSafeDumper as _YamlDumper
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeDumper as _YamlDumper  # type: ignore[assignment]
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
+
+_ENV_VAR_PATTERN = re.compile(r'\$\{([^}]+)\}')
+
+
+def _replace_env_var(match: re.Match[str]) -> str:
+    return os.environ.get(match.group(1), match.group(0))
 
 
 def resolve_env_var(value: str) -> str:
@@ -14,30 +31,59 @@ def resolve_env_var(value: str) -> str:
     if not isinstance(value, str):
         return value  # type: ignore[return-value]
 
-    pattern = r'\$\{([^}]+)\}'
+    if '${' not in value:
+        return value
+
+    return _ENV_VAR_PATTERN.sub(_replace_env_var, value)
 
-    def replace_var(match: re.Match[str]) -> str:
-        var_name = match.group(1)
-        return os.environ.get(var_name, match.group(0))
 
-    return re.sub(pattern, replace_var, value)
+def default_max_parallel() -> int:
+    """Default download concurrency: 3/4 of the CPUs, kept within 5-20."""
+    return min(20, max(5, (os.cpu_count() or 4) * 3 // 4))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ResolvedTarget:
     """Normalized target with resolved credentials.
 
     This is the internal representation after resolving credential profiles.
     All targets (flat or grouped format) are converted to this format.
+    Filters are stored as (name, value) pairs sorted by name so that targets
+    are hashable; use from_filters to build one from a filters dict.
     """
     platform: str
     username: str
     token: str | None
-    filters: dict[str, bool]
+    filters: tuple[tuple[str, bool], ...]
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.filters, tuple):
+            raise TypeError(
+                "ResolvedTarget.filters must be a tuple of (name, value) pairs; "
+                "use ResolvedTarget.from_filters() to build one from a dict"
+            )
+
+    @classmethod
+    def from_filters(
+        cls,
+        platform: str,
+        username: str,
+        token: str | None,
+        filters: Mapping[str, bool]
+    ) -> "ResolvedTarget":
+        """Create a target from a filters mapping, normalizing it to sorted pairs."""
+        return cls(platform, username, token, tuple(sorted(filters.items())))
+
+    @property
+    def filters_dict(self) -> dict[str, bool]:
+        """Filters as a dict, as expected by the API clients."""
+        return dict(self.filters)
 
 
 class CredentialProfile(BaseModel):
     """Named credential profile for a platform."""
+    model_config = ConfigDict(frozen=True)
+
     platform: Literal['github', 'gitlab']
     username: str = Field(min_length=1)
     token: str = Field(min_length=1)
@@ -59,6 +105,8 @@ class CredentialProfile(BaseModel):
 
 class TargetGroup(BaseModel):
     """Group of usernames sharing a credential."""
+    model_config = ConfigDict(frozen=True)
+
     credential: str = Field(min_length=1)
     usernames: list[str] = Field(min_length=1)
     filters: dict[str, bool] = Field(default_factory=dict)
@@ -81,6 +129,8 @@ class TargetGroup(BaseModel):
 
 class Credentials(BaseModel):
     """Authentication credentials for platforms."""
+    model_config = ConfigDict(frozen=True)
+
     # Legacy format (backward compatible)
     github_token: str | None = None
     gitlab_token: str | None = None
@@ -98,22 +148,35 @@ class Credentials(BaseModel):
 
 class DownloadConfig(BaseModel):
     """Configuration for download behavior."""
+    model_config = ConfigDict(frozen=True)
+
     base_directory: Path = Path('./repos')
-    max_parallel: int = Field(default=5, ge=1, le=20)
+    max_parallel: int = Field(default_factory=default_max_parallel, ge=1, le=20)
     include_forks: bool = True
     include_private: bool = True
+    # Clone only the latest commit (git clone --depth=1)
+    shallow: bool = False
+    # Partial clone filter spec passed to git, e.g. 'blob:none'
+    clone_filter: str | None = None
 
 
 class Target(BaseModel):
     """A platform/username target to download from."""
+    model_config = ConfigDict(frozen=True)
+
     platform: Literal['github', 'gitlab']
     username: str
     credential: str | None = None
     filters: dict[str, bool] = Field(default_factory=dict)
 
 
+_AppConfigT = TypeVar('_AppConfigT', bound='AppConfig')
+
+
 class AppConfig(BaseModel):
     """Complete application configuration."""
+    model_config = ConfigDict(frozen=True)
+
     credentials: Credentials
     download: DownloadConfig
     targets: list[Target] | dict[str, list[TargetGroup]]
@@ -161,15 +224,40 @@ class AppConfig(BaseModel):
                 f"but target uses {platform}"
             )
 
+    def model_copy(
+        self: _AppConfigT,
+        *,
+        update: Mapping[str, Any] | None = None,
+        deep: bool = False
+    ) -> _AppConfigT:
+        """Copy the config, dropping the cached target resolution.
+
+        model_copy copies the instance __dict__, where cached_property
+        stores its value, so the copy would otherwise keep the original
+        targets even when update replaces them.
+        """
+        copy = super().model_copy(update=update, deep=deep)
+        copy.__dict__.pop('resolved_targets', None)
+        return copy
+
     def resolve_targets(self) -> list[ResolvedTarget]:
         """Convert targets to normalized format with resolved credentials."""
+        return list(self.resolved_targets)
+
+    @cached_property
+    def resolved_targets(self) -> tuple[ResolvedTarget, ...]:
+        """Resolved targets, computed once per configuration instance.
+
+        Environment variable fallbacks are read on first access; call
+        model_copy() to get a config that resolves again.
+        """
         resolved = []
 
         if isinstance(self.targets, list):
             # Flat format
             for target in self.targets:
                 token = self._resolve_token(target.platform, target.credential)
-                resolved.append(ResolvedTarget(
+                resolved.append(ResolvedTarget.from_filters(
                     platform=target.platform,
                     username=target.username,
                     token=token,
@@ -181,14 +269,16 @@ class AppConfig(BaseModel):
                 for group in groups:
                     token = self._resolve_token(platform, group.credential)
                     for username in group.usernames:
-                        resolved.append(ResolvedTarget(
+                        resolved.append(ResolvedTarget.from_filters(
                             platform=platform,
                             username=username,
                             token=token,
                             filters=group.filters
                         ))
 
-        return resolved
+        # Drop exact duplicates (same user listed twice with the same token
+        # and filters) so each account is only listed once, keeping order
+        return tuple(dict.fromkeys(resolved))
 
     def _resolve_token(self, platform: str, credential: str | None) -> str | None:
         """Resolve token for a platform/credential combination."""
@@ -211,7 +301,7 @@ class AppConfig(BaseModel):
         """Load configuration from YAML file."""
         try:
             with open(path) as f:
-                data = yaml.safe_load(f)
+                data = yaml.load(f, Loader=_YamlLoader)
         except FileNotFoundError as e:
             raise FileNotFoundError(f"Configuration file not found: {path}") from e
         except yaml.YAMLError as e:
@@ -226,6 +316,6 @@ class AppConfig(BaseModel):
                 # Convert to dict, handle Path objects
                 data = self.model_dump(mode='python')
                 data['download']['base_directory'] = str(data['download']['base_directory'])
-                yaml.dump(data, f, default_flow_style=False)
+                yaml.dump(data, f, Dumper=_YamlDumper, default_flow_style=False)
         except OSError as e:
             raise OSError(f"Failed to write configuration file: {e}") from e
@@ -1,11 +1,30 @@
 # src/simple_repo_downloader/dashboard.py
+import time
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Deque, Dict, Optional
 from .models import RepoInfo, StateEnum
 
+# Oldest events are dropped once the log reaches this size
+MAX_EVENTS = 1000
 
-@dataclass
+# Events arrive in bursts, so the timestamp prefix is formatted once per second
+_event_second = -1
+_event_prefix = ''
+
+
+def _event_timestamp_prefix() -> str:
+    """Return the "[HH:MM:SS] " prefix for the current second."""
+    global _event_second, _event_prefix
+    now = time.time()
+    if int(now) != _event_second:
+        _event_second = int(now)
+        _event_prefix = time.strftime("[%H:%M:%S] ", time.localtime(now))
+    return _event_prefix
+
+
+@dataclass(slots=True)
 class RepoStatus:
     """Status of a single repository download."""
     repo: RepoInfo
@@ -16,11 +35,11 @@ class RepoStatus:
     completed_at: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DownloadStatus:
     """Overall download status for tracking."""
     repos: Dict[str, RepoStatus] = field(default_factory=dict)
-    events: List[str] = field(default_factory=list)
+    events: Deque[str] = field(default_factory=lambda: deque(maxlen=MAX_EVENTS))
     start_time: datetime = field(default_factory=datetime.now)
 
     def _count_by_state(self, state: StateEnum) -> int:
@@ -53,5 +72,4 @@ class DownloadStatus:
 
     def add_event(self, message: str) -> None:
         """Add event to log with timestamp."""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        self.events.append(f"[{timestamp}] {message}")
+        self.events.append(_event_timestamp_prefix() + message)
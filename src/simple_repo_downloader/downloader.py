@@ -1,18 +1,36 @@
 import asyncio
-import subprocess
-from dataclasses import dataclass
+import os
+import re
+from collections import deque
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Callable, List, Optional
+from typing import Awaitable, Callable, List, Optional, Union
 
 from .config import DownloadConfig
 from .models import DownloadIssue, DownloadResult, RepoInfo, IssueType, StateEnum
 
 
+# Abort transfers that stall below 1 KB/s for 30s, and never block on a
+# credential prompt: there is no terminal to answer it during bulk runs.
+GIT_ENV_DEFAULTS = {
+    'GIT_HTTP_LOW_SPEED_LIMIT': '1000',
+    'GIT_HTTP_LOW_SPEED_TIME': '30',
+    'GIT_TERMINAL_PROMPT': '0',
+}
+
+# git clone --progress redraws its counters with carriage returns
+_PROGRESS_LINE_SPLIT = re.compile(rb'[\r\n]')
+_PROGRESS_PATTERN = re.compile(rb'^(?:remote: )?([A-Za-z ]+):\s+(\d+)%')
+# Number of non-progress stderr lines kept for clone error messages
+STDERR_TAIL_LINES = 20
+
+
 @dataclass
 class DownloadResults:
     """Results from a batch download operation."""
     successful: List[DownloadResult]
     issues: List[DownloadIssue]
+    skipped: List[RepoInfo] = field(default_factory=list)
 
 
 class DownloadEngine:
@@ -24,53 +42,66 @@ class DownloadEngine:
         self.download_queue: asyncio.Queue[RepoInfo] = asyncio.Queue()
         self.results: List[DownloadResult] = []
         self.issues: List[DownloadIssue] = []
+        self.skipped: List[RepoInfo] = []
         self.status_callback = status_callback
+        self._base_dir = str(config.base_directory)
+        # Values already set in the environment take precedence
+        self._git_env = {**GIT_ENV_DEFAULTS, **os.environ}
 
-    async def _check_existing_repo(self, repo: RepoInfo) -> tuple[StateEnum, Optional[str]]:
+    def _repo_dest(self, repo: RepoInfo) -> str:
+        """Local checkout path for a repository."""
+        return os.path.join(self._base_dir, repo.platform, repo.username, repo.name)
+
+    async def _check_existing_repo(
+        self,
+        repo: RepoInfo,
+        dest: Optional[str] = None
+    ) -> tuple[StateEnum, Optional[str]]:
         """
         Check if repo exists locally and determine its git status.
         Returns (state, message) tuple.
         """
-        dest = self.config.base_directory / repo.platform / repo.username / repo.name
+        if dest is None:
+            dest = self._repo_dest(repo)
 
         # Check if directory exists
-        if not dest.exists():
+        if not os.path.exists(dest):
             return (None, None)  # Doesn't exist, proceed with clone
 
-        # Check if it's a git repo
-        if not (dest / '.git').exists():
+        # Check if it's a git repo (.git is a file for worktrees and submodules)
+        if not os.path.exists(os.path.join(dest, '.git')):
             return (StateEnum.FAILED, f"Directory exists but is not a git repo: {dest}")
 
         try:
             # Fetch latest from remote
             fetch_result = await asyncio.create_subprocess_exec(
-                'git', '-C', str(dest), 'fetch',
+                'git', '-C', dest, 'fetch',
                 stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
+                stderr=asyncio.subprocess.PIPE,
+                env=self._git_env
             )
             await fetch_result.wait()
 
-            # Check for uncommitted changes
+            # One status call reports both local changes and ahead/behind counts
             status_result = await asyncio.create_subprocess_exec(
-                'git', '-C', str(dest), 'status', '--porcelain',
+                'git', '-C', dest, 'status', '--porcelain=v2', '--branch',
                 stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
+                stderr=asyncio.subprocess.PIPE,
+                env=self._git_env
             )
             stdout, _ = await status_result.communicate()
-            has_uncommitted_changes = len(stdout.strip()) > 0
 
-            # Check if behind/ahead of remote
-            rev_list_result = await asyncio.create_subprocess_exec(
-                'git', '-C', str(dest), 'rev-list', '--left-right', '--count', 'HEAD...@{upstream}',
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            stdout, _ = await rev_list_result.communicate()
+            has_uncommitted_changes = False
+            ahead_behind = None
+            for line in stdout.decode().splitlines():
+                if line.startswith('# branch.ab '):
+                    ahead_behind = line.split()[2:4]
+                elif line and not line.startswith('#'):
+                    has_uncommitted_changes = True
 
-            if rev_list_result.returncode == 0:
-                parts = stdout.decode().strip().split()
-                ahead = int(parts[0]) if len(parts) > 0 else 0
-                behind = int(parts[1]) if len(parts) > 1 else 0
+            if ahead_behind is not None:
+                ahead = int(ahead_behind[0].lstrip('+'))
+                behind = int(ahead_behind[1].lstrip('-'))
 
                 # Decision tree based on user preferences
                 if has_uncommitted_changes and behind > 0:
@@ -82,9 +113,10 @@ class DownloadEngine:
                 elif behind > 0 and not has_uncommitted_changes:
                     # Pull latest changes
                     pull_result = await asyncio.create_subprocess_exec(
-                        'git', '-C', str(dest), 'pull',
+                        'git', '-C', dest, 'pull',
                         stdout=asyncio.subprocess.PIPE,
-                        stderr=asyncio.subprocess.PIPE
+                        stderr=asyncio.subprocess.PIPE,
+                        env=self._git_env
                     )
                     await pull_result.wait()
                     if pull_result.returncode == 0:
@@ -100,6 +132,14 @@ class DownloadEngine:
         except Exception as e:
             return (StateEnum.FAILED, f"Git status check failed: {str(e)}")
 
+    def _exclusion_reason(self, repo: RepoInfo) -> Optional[str]:
+        """Return why the download config excludes a repo, or None to download it."""
+        if repo.is_fork and not self.config.include_forks:
+            return "Skipped fork (include_forks is false)"
+        if repo.is_private and not self.config.include_private:
+            return "Skipped private repository (include_private is false)"
+        return None
+
     def _inject_token(self, clone_url: str, platform: str, token: Optional[str]) -> str:
         """Inject authentication token into clone URL."""
         if not token:
@@ -123,44 +163,93 @@ class DownloadEngine:
         self,
         repo: RepoInfo,
         callback: Optional[Callable],
-        token: Optional[str] = None
+        token: Optional[str] = None,
+        dest: Optional[str] = None
     ) -> None:
         """Clone a repository to the configured location."""
-        # Construct destination path
-        dest = self.config.base_directory / repo.platform / repo.username / repo.name
+        if dest is None:
+            dest = self._repo_dest(repo)
 
         # Check for conflicts
-        if dest.exists():
-            if (dest / '.git').exists():
+        if os.path.exists(dest):
+            if os.path.exists(os.path.join(dest, '.git')):
                 raise FileExistsError(f"Repository already exists: {dest}")
             else:
                 raise FileExistsError(f"Non-git directory exists: {dest}")
 
         # Create parent directories
-        dest.parent.mkdir(parents=True, exist_ok=True)
+        os.makedirs(os.path.dirname(dest), exist_ok=True)
 
         # Inject token into URL
         clone_url = self._inject_token(repo.clone_url, repo.platform, token)
 
-        # Execute git clone in thread pool
-        loop = asyncio.get_event_loop()
-        await loop.run_in_executor(
-            None,
-            self._git_clone_subprocess,
-            clone_url,
-            dest
-        )
+        status_callback = self.status_callback
+        if status_callback is None:
+            await self._git_clone(clone_url, dest)
+            return
 
-    def _git_clone_subprocess(self, url: str, dest: Path) -> None:
-        """Execute git clone using subprocess."""
-        result = subprocess.run(
-            ['git', 'clone', '--progress', url, str(dest)],
-            capture_output=True,
-            text=True
+        async def report_progress(pct: int) -> None:
+            await status_callback(repo, "downloading", pct, None)
+
+        await self._git_clone(clone_url, dest, report_progress)
+
+    def _clone_args(self, url: str, dest: Union[str, Path]) -> List[str]:
+        """Build the git clone command line for the configured clone mode."""
+        args = ['git', 'clone', '--progress']
+        if self.config.shallow:
+            args.append('--depth=1')
+        if self.config.clone_filter:
+            args.append(f'--filter={self.config.clone_filter}')
+        args.extend([url, str(dest)])
+        return args
+
+    async def _git_clone(
+        self,
+        url: str,
+        dest: Union[str, Path],
+        on_progress: Optional[Callable[[int], Awaitable[None]]] = None
+    ) -> None:
+        """
+        Execute git clone as an asyncio subprocess.
+
+        stderr is read as it arrives: "Receiving objects" percentages are
+        reported through on_progress, and only a short tail of the other
+        lines is kept for the error message.
+        """
+        process = await asyncio.create_subprocess_exec(
+            *self._clone_args(url, dest),
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE,
+            env=self._git_env
         )
 
-        if result.returncode != 0:
-            raise RuntimeError(f"Git clone failed: {result.stderr}")
+        stderr = process.stderr
+        assert stderr is not None
+
+        tail: deque[bytes] = deque(maxlen=STDERR_TAIL_LINES)
+        last_pct = -1
+        pending = b''
+        while chunk := await stderr.read(4096):
+            *lines, pending = _PROGRESS_LINE_SPLIT.split(pending + chunk)
+            for line in lines:
+                match = _PROGRESS_PATTERN.match(line)
+                if match is None:
+                    if line:
+                        tail.append(line)
+                    continue
+                if match.group(1) != b'Receiving objects':
+                    continue
+                pct = int(match.group(2))
+                if on_progress is not None and pct != last_pct:
+                    last_pct = pct
+                    await on_progress(pct)
+        if pending:
+            tail.append(pending)
+
+        await process.wait()
+        if process.returncode != 0:
+            message = b'\n'.join(tail).decode(errors='replace')
+            raise RuntimeError(f"Git clone failed: {message}")
 
     async def _worker(
         self,
@@ -172,9 +261,11 @@ class DownloadEngine:
         while True:
             try:
                 repo = await self.download_queue.get()
+                # Computed once and shared by the existence check and clone
+                dest = self._repo_dest(repo)
 
                 # Check if repo already exists locally
-                existing_state, existing_message = await self._check_existing_repo(repo)
+                existing_state, existing_message = await self._check_existing_repo(repo, dest)
 
                 if existing_state is not None:
                     # Repo exists, handle based on state
@@ -193,7 +284,7 @@ class DownloadEngine:
 
                 try:
                     async with self.semaphore:
-                        await self._clone_repo(repo, callback, token)
+                        await self._clone_repo(repo, callback, token, dest)
                         self.results.append(
                             DownloadResult(repo=repo, success=True)
                         )
@@ -207,7 +298,7 @@ class DownloadEngine:
                             repo=repo,
                             issue_type=IssueType.CONFLICT,
                             message=error_msg,
-                            existing_path=self.config.base_directory / repo.platform / repo.username / repo.name
+                            existing_path=Path(dest)
                         )
                     )
                     # Notify status: failed with error message
@@ -254,9 +345,16 @@ class DownloadEngine:
         # Clear previous results
         self.results = []
         self.issues = []
+        self.skipped = []
 
-        # Populate queue
+        # Populate queue, leaving out repos excluded by the download config
         for repo in repos:
+            reason = self._exclusion_reason(repo)
+            if reason is not None:
+                self.skipped.append(repo)
+                if self.status_callback:
+                    await self.status_callback(repo, StateEnum.SKIPPED.value, 0, reason)
+                continue
             await self.download_queue.put(repo)
 
         # Spawn workers
@@ -277,5 +375,6 @@ class DownloadEngine:
 
         return DownloadResults(
             successful=self.results,
-            issues=self.issues
+            issues=self.issues,
+            skipped=self.skipped
         )
@@ -5,7 +5,7 @@ from pathlib import Path
 from typing import Optional
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RepoInfo:
     """Information about a repository to be downloaded."""
 
@@ -31,7 +31,9 @@ class IssueType(Enum):
     RATE_LIMIT = "rate_limit"
 
 
-class StateEnum(Enum):
+# The str mixin hashes members with str's C hash rather than Enum.__hash__,
+# which is on the path of every status update's state count and emoji lookup
+class StateEnum(str, Enum):
     """Repository download states."""
 
     QUEUED = "queued"
@@ -46,7 +48,19 @@ class StateEnum(Enum):
     AHEAD = "ahead"
 
 
-@dataclass(frozen=True)
+# States after which a repository needs no further work in this run
+TERMINAL_STATES = frozenset({
+    StateEnum.COMPLETED,
+    StateEnum.FAILED,
+    StateEnum.SKIPPED,
+    StateEnum.UPDATED,
+    StateEnum.UP_TO_DATE,
+    StateEnum.UNCOMMITTED_CHANGES,
+    StateEnum.AHEAD,
+})
+
+
+@dataclass(frozen=True, slots=True)
 class DownloadResult:
     """Result of a repository download attempt."""
 
@@ -55,7 +69,7 @@ class DownloadResult:
     error: Optional[str] = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DownloadIssue:
     """An issue that occurred during download."""
 
@@ -66,7 +80,7 @@ class DownloadIssue:
     timestamp: datetime = field(default_factory=lambda: datetime.now())
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RateLimitInfo:
     """Rate limit information from API."""
 
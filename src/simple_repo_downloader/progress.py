@@ -1,14 +1,18 @@
+import time
 from collections import Counter
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from types import TracebackType
+from typing import List, Optional, TextIO, Type
 
 from rich.console import Console
-from rich.markdown import Markdown
 
 from .models import RepoInfo, StateEnum
 from .dashboard import DownloadStatus
 
+# Timestamp format for log lines
+_LOG_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
 
 class ProgressPrinter:
     """Progress printer that outputs to console and log file."""
@@ -31,9 +35,12 @@ class ProgressPrinter:
         self.log_file = log_file
         self.start_time = datetime.now()
 
-        # Create log directory if needed
+        self._log_fp: Optional[TextIO] = None
+
+        # Create log directory and open the log once for the whole run
         if self.log_file:
             self.log_file.parent.mkdir(parents=True, exist_ok=True)
+            self._log_fp = open(self.log_file, 'a', encoding='utf-8')
 
     def print_start(self, repos: List[RepoInfo], max_parallel: int) -> None:
         """Print initial header with repository counts."""
@@ -130,15 +137,35 @@ class ProgressPrinter:
 **Total:** {len(status.repos)} repositories processed | **Time:** {elapsed_str}
 """
 
-        # Print to console with Rich markdown rendering
+        # Print to console with Rich markdown rendering; imported here because
+        # rich.markdown pulls in markdown-it, which only the summary needs
+        from rich.markdown import Markdown
         self.console.print(Markdown(md))
 
         # Log plain text version
         self._log("\n" + md)
 
+    def close(self) -> None:
+        """Close the log file."""
+        if self._log_fp is not None:
+            self._log_fp.close()
+            self._log_fp = None
+
+    def __enter__(self) -> "ProgressPrinter":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType]
+    ) -> None:
+        self.close()
+
     def _log(self, message: str) -> None:
         """Write message to log file with timestamp."""
-        if self.log_file:
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            with open(self.log_file, 'a') as f:
-                f.write(f"{timestamp} | {message}")
+        if self._log_fp is not None:
+            timestamp = time.strftime(_LOG_TIMESTAMP_FORMAT)
+            self._log_fp.write(f"{timestamp} | {message}")
+            # Flush so the log is readable while the run is in progress
+            self._log_fp.flush()
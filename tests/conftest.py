@@ -0,0 +1,56 @@
+# tests/conftest.py
+import hashlib
+import subprocess
+from pathlib import Path
+
+import pytest
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--run-network", action="store_true", default=False,
+        help="run tests marked 'network' that clone from real hosts"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip network tests unless requested, and fail fast on duplicate modules."""
+    if not config.getoption("--run-network"):
+        skip_network = pytest.mark.skip(reason="needs --run-network")
+        for item in items:
+            if "network" in item.keywords:
+                item.add_marker(skip_network)
+
+    seen: dict[str, Path] = {}
+    for path in sorted({Path(item.fspath) for item in items}):
+        digest = hashlib.sha256(path.read_bytes()).hexdigest()
+        if digest in seen:
+            raise pytest.UsageError(
+                f"Duplicate test module content: {path} == {seen[digest]}"
+            )
+        seen[digest] = path
+
+
+@pytest.fixture(scope="session")
+def template_git_repo(tmp_path_factory):
+    """A git repo with one committed README, built once; copy it before use."""
+    path = tmp_path_factory.mktemp("template") / "repo"
+    path.mkdir()
+    (path / 'README.md').write_text('# Test Repo')
+    for args in (['init'], ['add', '.'], ['commit', '-m', 'Initial commit']):
+        subprocess.run(
+            ['git', '-c', 'user.email=test@test.com', '-c', 'user.name=Test User', *args],
+            cwd=path, check=True, capture_output=True
+        )
+    return path
+
+
+@pytest.fixture(scope="session")
+def local_remote(template_git_repo, tmp_path_factory):
+    """Bare clone of template_git_repo, used as a clone source over file://."""
+    path = tmp_path_factory.mktemp("remote") / "Hello-World.git"
+    subprocess.run(
+        ['git', 'clone', '--bare', str(template_git_repo), str(path)],
+        check=True, capture_output=True
+    )
+    return path
@@ -14,6 +14,7 @@ from simple_repo_downloader.config import (
     DownloadConfig,
     Target,
     TargetGroup,
+    default_max_parallel,
     resolve_env_var,
 )
 
@@ -111,11 +112,17 @@ def test_credentials_mixed_legacy_and_profiles():
 def test_download_config_defaults():
     config = DownloadConfig()
     assert config.base_directory == Path('./repos')
-    assert config.max_parallel == 5
+    assert config.max_parallel == default_max_parallel()
     assert config.include_forks is True
     assert config.include_private is True
 
 
+@pytest.mark.parametrize("cpus,expected", [(None, 5), (1, 5), (8, 6), (16, 12), (64, 20)])
+def test_default_max_parallel_tracks_cpu_count(monkeypatch, cpus, expected):
+    monkeypatch.setattr(os, 'cpu_count', lambda: cpus)
+    assert default_max_parallel() == expected
+
+
 def test_download_config_custom_values():
     config = DownloadConfig(
         base_directory=Path('/custom/path'),
@@ -145,6 +152,12 @@ def test_download_config_max_parallel_validation():
         DownloadConfig(max_parallel=21)
 
 
+def test_download_config_is_immutable():
+    config = DownloadConfig()
+    with pytest.raises(ValidationError):
+        config.max_parallel = 10
+
+
 # Test Target
 def test_target_github():
     target = Target(platform='github', username='torvalds')
@@ -71,3 +71,47 @@ def test_download_status_add_event():
     assert len(status.events) == 1
     assert "Started download" in status.events[0]
     assert "]" in status.events[0]  # Has timestamp
+
+
+def test_download_status_counts_follow_state_changes():
+    """Test counts stay correct when repo states change or repos are replaced."""
+    repo = RepoInfo(
+        platform="github",
+        username="user",
+        name="repo",
+        clone_url="https://github.com/user/repo.git",
+        is_fork=False,
+        is_private=False,
+        is_archived=False,
+        size_kb=1000,
+        default_branch="main"
+    )
+
+    status = DownloadStatus()
+    status.repos["repo"] = RepoStatus(repo=repo, state=StateEnum.QUEUED)
+    assert status.queued_count == 1
+
+    status.repos["repo"].state = StateEnum.DOWNLOADING
+    assert status.queued_count == 0
+    assert status.downloading_count == 1
+
+    status.repos["repo"] = RepoStatus(repo=repo, state=StateEnum.COMPLETED)
+    assert status.downloading_count == 0
+    assert status.completed_count == 1
+
+    del status.repos["repo"]
+    assert status.completed_count == 0
+    assert len(status.repos) == 0
+
+
+def test_download_status_events_are_bounded():
+    """Test the event log keeps only the most recent MAX_EVENTS entries."""
+    from simple_repo_downloader.dashboard import MAX_EVENTS
+
+    status = DownloadStatus()
+    for i in range(MAX_EVENTS + 5):
+        status.add_event(f"event {i}")
+
+    assert len(status.events) == MAX_EVENTS
+    assert status.events[0].endswith("event 5")
+    assert status.events[-1].endswith(f"event {MAX_EVENTS + 4}")
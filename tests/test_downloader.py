@@ -19,17 +19,17 @@ def test_download_engine_initialization():
 
 
 @pytest.mark.asyncio
-async def test_clone_repo_success(tmp_path):
+async def test_clone_repo_success(tmp_path, local_remote):
     """Test successful repository clone."""
     config = DownloadConfig(base_directory=tmp_path, max_parallel=1)
     engine = DownloadEngine(config)
 
-    # Use a small public repo for testing
+    # Clone from a local bare repo so the test does not need network access
     repo = RepoInfo(
         platform='github',
         username='test-user',
         name='test-repo',
-        clone_url='https://github.com/octocat/Hello-World.git',
+        clone_url=local_remote.as_uri(),
         is_fork=False,
         is_private=False,
         is_archived=False,
@@ -44,8 +44,30 @@ async def test_clone_repo_success(tmp_path):
     assert (expected_path / '.git').exists()
 
 
+@pytest.mark.network
 @pytest.mark.asyncio
-async def test_download_all_with_multiple_repos(tmp_path):
+async def test_clone_repo_from_github(tmp_path):
+    """Test cloning a small public repository from GitHub."""
+    engine = DownloadEngine(DownloadConfig(base_directory=tmp_path, max_parallel=1))
+    repo = RepoInfo(
+        platform='github',
+        username='octocat',
+        name='Hello-World',
+        clone_url='https://github.com/octocat/Hello-World.git',
+        is_fork=False,
+        is_private=False,
+        is_archived=False,
+        size_kb=100,
+        default_branch='master'
+    )
+
+    await engine._clone_repo(repo, None)
+
+    assert (tmp_path / 'github' / 'octocat' / 'Hello-World' / '.git').exists()
+
+
+@pytest.mark.asyncio
+async def test_download_all_with_multiple_repos(tmp_path, local_remote):
     """Test downloading multiple repositories in parallel."""
     config = DownloadConfig(base_directory=tmp_path, max_parallel=2)
     engine = DownloadEngine(config)
@@ -55,7 +77,7 @@ async def test_download_all_with_multiple_repos(tmp_path):
             platform='github',
             username='octocat',
             name='Hello-World',
-            clone_url='https://github.com/octocat/Hello-World.git',
+            clone_url=local_remote.as_uri(),
             is_fork=False,
             is_private=False,
             is_archived=False,
@@ -66,7 +88,7 @@ async def test_download_all_with_multiple_repos(tmp_path):
             platform='github',
             username='octocat',
             name='Spoon-Knife',
-            clone_url='https://github.com/octocat/Spoon-Knife.git',
+            clone_url=local_remote.as_uri(),
             is_fork=False,
             is_private=False,
             is_archived=False,
@@ -82,9 +104,8 @@ async def test_download_all_with_multiple_repos(tmp_path):
 
 
 @pytest.mark.asyncio
-async def test_check_existing_repo_scenarios(tmp_path):
+async def test_check_existing_repo_scenarios(tmp_path, template_git_repo):
     """Test various git status scenarios for existing repos."""
-    import subprocess
     from simple_repo_downloader.models import StateEnum
 
     config = DownloadConfig(base_directory=tmp_path, max_parallel=1)
@@ -126,19 +147,9 @@ async def test_check_existing_repo_scenarios(tmp_path):
     assert 'not a git repo' in message
 
     # Scenario 3: Valid git repo, up to date
-    # Create a small test repo
+    # Copy a small committed test repo into place
     git_repo_path = tmp_path / 'github' / 'test' / 'existing-repo'
-    git_repo_path.mkdir(parents=True)
-
-    # Initialize git repo
-    subprocess.run(['git', 'init'], cwd=git_repo_path, check=True, capture_output=True)
-    subprocess.run(['git', 'config', 'user.email', 'test@test.com'], cwd=git_repo_path, check=True, capture_output=True)
-    subprocess.run(['git', 'config', 'user.name', 'Test User'], cwd=git_repo_path, check=True, capture_output=True)
-
-    # Create initial commit
-    (git_repo_path / 'README.md').write_text('# Test Repo')
-    subprocess.run(['git', 'add', '.'], cwd=git_repo_path, check=True, capture_output=True)
-    subprocess.run(['git', 'commit', '-m', 'Initial commit'], cwd=git_repo_path, check=True, capture_output=True)
+    shutil.copytree(template_git_repo, git_repo_path)
 
     # Note: Without a remote, git fetch will fail, so this will likely return UP_TO_DATE or FAILED
     repo_existing = RepoInfo(
@@ -159,7 +170,7 @@ async def test_check_existing_repo_scenarios(tmp_path):
 
 
 @pytest.mark.asyncio
-async def test_download_with_status_callback():
+async def test_download_with_status_callback(local_remote):
     from simple_repo_downloader.downloader import DownloadEngine
     from simple_repo_downloader.config import DownloadConfig
     from simple_repo_downloader.models import RepoInfo
@@ -180,7 +191,7 @@ async def test_download_with_status_callback():
                 platform="github",
                 username="octocat",
                 name="Hello-World",
-                clone_url="https://github.com/octocat/Hello-World.git",
+                clone_url=local_remote.as_uri(),
                 is_fork=False,
                 is_private=False,
                 is_archived=False,
@@ -200,3 +211,166 @@ async def test_download_with_status_callback():
         # Should have downloading and completed states
         states = [update[1] for update in status_updates]
         assert "downloading" in states and "completed" in states
+
+
+def test_clone_args_reflect_clone_mode(tmp_path):
+    """Test shallow and partial clone options are passed to git clone."""
+    dest = tmp_path / 'repo'
+
+    engine = DownloadEngine(DownloadConfig(base_directory=tmp_path))
+    assert engine._clone_args('url', dest) == ['git', 'clone', '--progress', 'url', str(dest)]
+
+    engine = DownloadEngine(DownloadConfig(
+        base_directory=tmp_path,
+        shallow=True,
+        clone_filter='blob:none'
+    ))
+    assert engine._clone_args('url', dest) == [
+        'git', 'clone', '--progress', '--depth=1', '--filter=blob:none', 'url', str(dest)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_check_existing_repo_with_upstream(tmp_path):
+    """Test ahead/behind detection against a local upstream repository."""
+    import subprocess
+    from simple_repo_downloader.models import StateEnum
+
+    def git(*args, cwd):
+        subprocess.run(
+            ['git', '-c', 'user.email=test@test.com', '-c', 'user.name=Test User', *args],
+            cwd=cwd, check=True, capture_output=True
+        )
+
+    # Bare upstream with one commit, pushed from a scratch clone
+    upstream = tmp_path / 'upstream.git'
+    git('init', '--bare', str(upstream), cwd=tmp_path)
+    scratch = tmp_path / 'scratch'
+    git('clone', str(upstream), str(scratch), cwd=tmp_path)
+    (scratch / 'README.md').write_text('# Test Repo')
+    git('add', '.', cwd=scratch)
+    git('commit', '-m', 'Initial commit', cwd=scratch)
+    git('push', 'origin', 'HEAD', cwd=scratch)
+
+    config = DownloadConfig(base_directory=tmp_path / 'repos', max_parallel=1)
+    engine = DownloadEngine(config)
+    repo = RepoInfo(
+        platform='github',
+        username='test',
+        name='tracked',
+        clone_url=str(upstream),
+        is_fork=False,
+        is_private=False,
+        is_archived=False,
+        size_kb=100,
+        default_branch='main'
+    )
+    local = tmp_path / 'repos' / 'github' / 'test' / 'tracked'
+    git('clone', str(upstream), str(local), cwd=tmp_path)
+
+    # Local commit not yet pushed
+    (local / 'local.txt').write_text('local')
+    git('add', '.', cwd=local)
+    git('commit', '-m', 'Local commit', cwd=local)
+    state, message = await engine._check_existing_repo(repo)
+    assert state == StateEnum.AHEAD
+    assert '1 commits ahead' in message
+
+    # Upstream moves on; reset local so it is strictly behind
+    git('reset', '--hard', 'HEAD~1', cwd=local)
+    (scratch / 'new.txt').write_text('new')
+    git('add', '.', cwd=scratch)
+    git('commit', '-m', 'Upstream commit', cwd=scratch)
+    git('push', 'origin', 'HEAD', cwd=scratch)
+    state, message = await engine._check_existing_repo(repo)
+    assert state == StateEnum.UPDATED
+    assert (local / 'new.txt').exists()
+
+
+def test_git_env_defaults(tmp_path, monkeypatch):
+    """Test git subprocesses never prompt and honour user overrides."""
+    monkeypatch.delenv('GIT_TERMINAL_PROMPT', raising=False)
+    monkeypatch.setenv('GIT_HTTP_LOW_SPEED_TIME', '120')
+
+    engine = DownloadEngine(DownloadConfig(base_directory=tmp_path))
+
+    assert engine._git_env['GIT_TERMINAL_PROMPT'] == '0'
+    assert engine._git_env['GIT_HTTP_LOW_SPEED_LIMIT'] == '1000'
+    assert engine._git_env['GIT_HTTP_LOW_SPEED_TIME'] == '120'
+
+
+@pytest.mark.asyncio
+async def test_git_clone_reports_progress(tmp_path, template_git_repo):
+    """Test clone progress is streamed and failures keep git's message."""
+    engine = DownloadEngine(DownloadConfig(base_directory=tmp_path))
+    progress = []
+
+    async def on_progress(pct):
+        progress.append(pct)
+
+    await engine._git_clone(template_git_repo.as_uri(), tmp_path / 'clone', on_progress)
+
+    assert (tmp_path / 'clone' / 'README.md').exists()
+    assert progress and progress[-1] == 100
+    assert progress == sorted(set(progress))
+
+    with pytest.raises(RuntimeError, match="does not appear to be a git repository|not found"):
+        await engine._git_clone((tmp_path / 'missing').as_uri(), tmp_path / 'other')
+
+
+def test_repo_dest(tmp_path):
+    """Test the checkout path is platform/username/name under the base directory."""
+    engine = DownloadEngine(DownloadConfig(base_directory=tmp_path))
+    repo = RepoInfo(
+        platform='gitlab',
+        username='group',
+        name='project',
+        clone_url='https://gitlab.com/group/project.git',
+        is_fork=False,
+        is_private=False,
+        is_archived=False,
+        size_kb=1,
+        default_branch='main'
+    )
+
+    assert Path(engine._repo_dest(repo)) == tmp_path / 'gitlab' / 'group' / 'project'
+
+
+@pytest.mark.asyncio
+async def test_download_all_skips_excluded_repos(tmp_path):
+    """Test forks and private repos are skipped when the config excludes them."""
+    status_updates = []
+
+    async def status_callback(repo, state, progress, error):
+        status_updates.append((repo.name, state, error))
+
+    config = DownloadConfig(
+        base_directory=tmp_path,
+        include_forks=False,
+        include_private=False
+    )
+    engine = DownloadEngine(config, status_callback=status_callback)
+
+    def make_repo(name, is_fork, is_private):
+        return RepoInfo(
+            platform='github',
+            username='test',
+            name=name,
+            clone_url=f'https://github.com/test/{name}.git',
+            is_fork=is_fork,
+            is_private=is_private,
+            is_archived=False,
+            size_kb=1,
+            default_branch='main'
+        )
+
+    repos = [make_repo('forked', True, False), make_repo('secret', False, True)]
+    results = await engine.download_all(repos)
+
+    assert results.skipped == repos
+    assert results.successful == [] and results.issues == []
+    assert [(name, state) for name, state, _ in status_updates] == [
+        ('forked', 'skipped'), ('secret', 'skipped')
+    ]
+    assert 'include_forks' in status_updates[0][2]
+    assert not (tmp_path / 'github').exists()
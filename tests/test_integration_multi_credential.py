@@ -65,7 +65,7 @@ targets:
     assert resolved[0].platform == 'github'
     assert resolved[0].username == 'torvalds'
     assert resolved[0].token == 'ghp_personal_token'
-    assert resolved[0].filters == {'forks': False}
+    assert resolved[0].filters_dict == {'forks': False}
 
     assert resolved[1].platform == 'github'
     assert resolved[1].username == 'kubernetes'
@@ -75,7 +75,7 @@ targets:
     assert resolved[2].platform == 'github'
     assert resolved[2].username == 'company-org'
     assert resolved[2].token == 'ghp_work_token'
-    assert resolved[2].filters == {}
+    assert resolved[2].filters_dict == {}
 
     # GitLab target
     assert resolved[3].platform == 'gitlab'
@@ -249,7 +249,7 @@ targets:
 
     assert len(resolved) == 3
     # First group has forks: false
-    assert resolved[0].filters == {'forks': False, 'archived': False}
-    assert resolved[1].filters == {'forks': False, 'archived': False}
+    assert resolved[0].filters_dict == {'forks': False, 'archived': False}
+    assert resolved[1].filters_dict == {'forks': False, 'archived': False}
     # Second group has forks: true
-    assert resolved[2].filters == {'forks': True}
+    assert resolved[2].filters_dict == {'forks': True}
@@ -125,3 +125,21 @@ def test_issue_type_enum():
     assert IssueType.AUTH_ERROR.value == "auth"
     assert IssueType.GIT_ERROR.value == "git"
     assert IssueType.RATE_LIMIT.value == "rate_limit"
+
+
+def test_terminal_states():
+    from simple_repo_downloader.models import TERMINAL_STATES, StateEnum
+
+    assert StateEnum.COMPLETED in TERMINAL_STATES
+    assert StateEnum.FAILED in TERMINAL_STATES
+    assert StateEnum.QUEUED not in TERMINAL_STATES
+    assert StateEnum.DOWNLOADING not in TERMINAL_STATES
+    assert StateEnum.PAUSED not in TERMINAL_STATES
+
+
+def test_state_enum_is_str_valued():
+    from simple_repo_downloader.models import StateEnum
+
+    assert StateEnum.COMPLETED == "completed"
+    assert StateEnum("up_to_date") is StateEnum.UP_TO_DATE
+    assert {StateEnum.FAILED: 1}["failed"] == 1
@@ -5,20 +5,54 @@ from simple_repo_downloader.models import RepoInfo, StateEnum
 from simple_repo_downloader.dashboard import DownloadStatus, RepoStatus
 
 
-def test_progress_printer_initialization(tmp_path):
-    """Test ProgressPrinter initializes with log file path."""
-    log_file = tmp_path / "test.log"
-    printer = ProgressPrinter(log_file=log_file)
+@pytest.fixture
+def log_file(tmp_path):
+    return tmp_path / "test.log"
+
 
+@pytest.fixture
+def printer(log_file):
+    """ProgressPrinter logging to log_file, closed after the test."""
+    with ProgressPrinter(log_file=log_file) as printer:
+        yield printer
+
+
+def test_progress_printer_initialization(log_file, printer):
+    """Test ProgressPrinter initializes with log file path."""
     assert printer.log_file == log_file
     assert printer.start_time is not None
 
 
-def test_print_start(tmp_path, capsys):
-    """Test print_start displays repository count."""
+def test_progress_printer_close(tmp_path):
+    """Test close() releases the log file and later lines are not logged."""
     log_file = tmp_path / "test.log"
     printer = ProgressPrinter(log_file=log_file)
 
+    printer._log("before close\n")
+    printer.close()
+    printer._log("after close\n")
+    printer.close()  # Closing twice is harmless
+
+    log_content = log_file.read_text()
+    assert "before close" in log_content
+    assert "after close" not in log_content
+
+
+def test_progress_printer_context_manager(tmp_path):
+    """Test the log file is closed when the with block exits, even on error."""
+    log_file = tmp_path / "test.log"
+
+    with pytest.raises(RuntimeError):
+        with ProgressPrinter(log_file=log_file) as printer:
+            printer._log("inside\n")
+            raise RuntimeError("boom")
+
+    assert printer._log_fp is None
+    assert "inside" in log_file.read_text()
+
+
+def test_print_start(log_file, printer, capsys):
+    """Test print_start displays repository count."""
     repos = [
         RepoInfo(
             platform='github',
@@ -60,11 +94,8 @@ def test_print_start(tmp_path, capsys):
     assert re.search(r"\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2} \|", log_content), "Log should have timestamp format: YYYY-MM-DD HH:MM:SS |"
 
 
-def test_print_repo_update(tmp_path, capsys):
+def test_print_repo_update(log_file, printer, capsys):
     """Test print_repo_update displays progress line."""
-    log_file = tmp_path / "test.log"
-    printer = ProgressPrinter(log_file=log_file)
-
     repo = RepoInfo(
         platform='github',
         username='test',
@@ -109,11 +140,8 @@ def test_print_repo_update(tmp_path, capsys):
     (StateEnum.PAUSED, "⏸"),
     (StateEnum.SKIPPED, "⏭"),
 ])
-def test_print_repo_update_all_states(tmp_path, capsys, state, expected_emoji):
+def test_print_repo_update_all_states(printer, capsys, state, expected_emoji):
     """Test print_repo_update displays correct emoji for each state."""
-    log_file = tmp_path / "test.log"
-    printer = ProgressPrinter(log_file=log_file)
-
     repo = RepoInfo(
         platform='github',
         username='test',
@@ -138,11 +166,8 @@ def test_print_repo_update_all_states(tmp_path, capsys, state, expected_emoji):
     assert expected_emoji in captured.out
 
 
-def test_print_summary(tmp_path, capsys):
+def test_print_summary(printer, capsys):
     """Test print_summary displays markdown table."""
-    log_file = tmp_path / "test.log"
-    printer = ProgressPrinter(log_file=log_file)
-
     # Create status with some repos
     status = DownloadStatus()
 
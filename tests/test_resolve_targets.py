@@ -1,24 +1,44 @@
 # tests/test_resolve_targets.py
-import os
+import pytest
+
 from simple_repo_downloader.config import (
     AppConfig, Credentials, CredentialProfile,
     DownloadConfig, Target, TargetGroup
 )
 
 
-def test_resolve_targets_flat_format_with_profile():
-    """Test resolving flat format targets with credential profiles."""
+# The config models are frozen, so these can be shared across tests.
+@pytest.fixture(scope="module")
+def github_profile():
+    return CredentialProfile(platform='github', username='test', token='ghp_profile_token')
+
+
+@pytest.fixture(scope="module")
+def personal_profile():
+    return CredentialProfile(platform='github', username='personal', token='ghp_personal')
+
+
+@pytest.fixture(scope="module")
+def work_profile():
+    return CredentialProfile(platform='github', username='work', token='ghp_work')
+
+
+@pytest.fixture(scope="module")
+def empty_credentials():
+    return Credentials()
+
+
+@pytest.fixture(scope="module")
+def download_config():
+    return DownloadConfig()
+
+
+@pytest.fixture(scope="module")
+def flat_profile_resolved(github_profile, download_config):
+    """Flat format targets resolved through a profile, shared as an immutable tuple."""
     config = AppConfig(
-        credentials=Credentials(
-            profiles={
-                'my-github': CredentialProfile(
-                    platform='github',
-                    username='test',
-                    token='ghp_profile_token'
-                )
-            }
-        ),
-        download=DownloadConfig(),
+        credentials=Credentials(profiles={'my-github': github_profile}),
+        download=download_config,
         targets=[
             Target(
                 platform='github',
@@ -28,23 +48,29 @@ def test_resolve_targets_flat_format_with_profile():
             )
         ]
     )
+    return tuple(config.resolve_targets())
 
-    resolved = config.resolve_targets()
 
-    assert len(resolved) == 1
-    assert resolved[0].platform == 'github'
-    assert resolved[0].username == 'user1'
-    assert resolved[0].token == 'ghp_profile_token'
-    assert resolved[0].filters == {'forks': False}
+def test_resolve_targets_flat_format_with_profile(flat_profile_resolved):
+    """Test resolving flat format targets with credential profiles."""
+    assert len(flat_profile_resolved) == 1
+    assert flat_profile_resolved[0].platform == 'github'
+    assert flat_profile_resolved[0].username == 'user1'
+    assert flat_profile_resolved[0].token == 'ghp_profile_token'
+
+
+def test_resolve_targets_flat_format_keeps_filters(flat_profile_resolved):
+    """Test target filters carry through resolution."""
+    assert flat_profile_resolved[0].filters_dict == {'forks': False}
 
 
-def test_resolve_targets_flat_format_legacy_token():
+def test_resolve_targets_flat_format_legacy_token(download_config):
     """Test resolving flat format with legacy tokens."""
     config = AppConfig(
         credentials=Credentials(
             github_token='ghp_legacy_token'
         ),
-        download=DownloadConfig(),
+        download=download_config,
         targets=[
             Target(platform='github', username='user1')
         ]
@@ -56,13 +82,13 @@ def test_resolve_targets_flat_format_legacy_token():
     assert resolved[0].token == 'ghp_legacy_token'
 
 
-def test_resolve_targets_flat_format_env_var():
+def test_resolve_targets_flat_format_env_var(monkeypatch, empty_credentials, download_config):
     """Test resolving flat format with env var fallback."""
-    os.environ['GITHUB_TOKEN'] = 'ghp_from_env'
+    monkeypatch.setenv('GITHUB_TOKEN', 'ghp_from_env')
 
     config = AppConfig(
-        credentials=Credentials(),
-        download=DownloadConfig(),
+        credentials=empty_credentials,
+        download=download_config,
         targets=[
             Target(platform='github', username='user1')
         ]
@@ -73,100 +99,62 @@ def test_resolve_targets_flat_format_env_var():
     assert len(resolved) == 1
     assert resolved[0].token == 'ghp_from_env'
 
-    del os.environ['GITHUB_TOKEN']
 
-
-def test_resolve_targets_grouped_format():
-    """Test resolving grouped format targets."""
-    config = AppConfig(
-        credentials=Credentials(
-            profiles={
-                'my-github': CredentialProfile(
-                    platform='github',
-                    username='test',
-                    token='ghp_token123'
-                )
-            }
+@pytest.mark.parametrize("groups, expected", [
+    pytest.param(
+        [('my-github', ['user1', 'user2', 'user3'], {'forks': False})],
+        (
+            ('github', 'user1', 'ghp_profile_token', (('forks', False),)),
+            ('github', 'user2', 'ghp_profile_token', (('forks', False),)),
+            ('github', 'user3', 'ghp_profile_token', (('forks', False),)),
         ),
-        download=DownloadConfig(),
-        targets={
-            'github': [
-                TargetGroup(
-                    credential='my-github',
-                    usernames=['user1', 'user2', 'user3'],
-                    filters={'forks': False}
-                )
-            ]
-        }
-    )
-
-    resolved = config.resolve_targets()
-
-    assert len(resolved) == 3
-    assert resolved[0].platform == 'github'
-    assert resolved[0].username == 'user1'
-    assert resolved[0].token == 'ghp_token123'
-    assert resolved[0].filters == {'forks': False}
-    assert resolved[1].username == 'user2'
-    assert resolved[2].username == 'user3'
-
-
-def test_resolve_targets_multiple_groups_same_platform():
-    """Test resolving multiple groups for same platform."""
-    config = AppConfig(
-        credentials=Credentials(
-            profiles={
-                'personal': CredentialProfile(
-                    platform='github',
-                    username='personal',
-                    token='ghp_personal'
-                ),
-                'work': CredentialProfile(
-                    platform='github',
-                    username='work',
-                    token='ghp_work'
-                )
-            }
+        id="single-group",
+    ),
+    pytest.param(
+        [('personal', ['user1', 'user2'], {}), ('work', ['company-org'], {})],
+        (
+            ('github', 'user1', 'ghp_personal', ()),
+            ('github', 'user2', 'ghp_personal', ()),
+            ('github', 'company-org', 'ghp_work', ()),
         ),
-        download=DownloadConfig(),
+        id="multiple-groups-same-platform",
+    ),
+])
+def test_resolve_targets_grouped_format(
+    groups, expected, github_profile, personal_profile, work_profile, download_config
+):
+    """Test resolving grouped format targets, in group then username order."""
+    config = AppConfig(
+        credentials=Credentials(profiles={
+            'my-github': github_profile,
+            'personal': personal_profile,
+            'work': work_profile,
+        }),
+        download=download_config,
         targets={
             'github': [
-                TargetGroup(
-                    credential='personal',
-                    usernames=['user1', 'user2']
-                ),
-                TargetGroup(
-                    credential='work',
-                    usernames=['company-org']
-                )
+                TargetGroup(credential=credential, usernames=usernames, filters=filters)
+                for credential, usernames, filters in groups
             ]
         }
     )
 
     resolved = config.resolve_targets()
 
-    assert len(resolved) == 3
-    assert resolved[0].token == 'ghp_personal'
-    assert resolved[1].token == 'ghp_personal'
-    assert resolved[2].token == 'ghp_work'
+    actual = tuple((r.platform, r.username, r.token, r.filters) for r in resolved)
+    assert actual == expected
 
 
-def test_token_resolution_priority():
+def test_token_resolution_priority(monkeypatch, github_profile, download_config):
     """Test token resolution follows correct priority."""
-    os.environ['GITHUB_TOKEN'] = 'ghp_env'
+    monkeypatch.setenv('GITHUB_TOKEN', 'ghp_env')
 
     config = AppConfig(
         credentials=Credentials(
             github_token='ghp_legacy',
-            profiles={
-                'my-github': CredentialProfile(
-                    platform='github',
-                    username='test',
-                    token='ghp_profile'
-                )
-            }
+            profiles={'my-github': github_profile}
         ),
-        download=DownloadConfig(),
+        download=download_config,
         targets=[
             Target(platform='github', username='user1', credential='my-github'),
             Target(platform='github', username='user2'),
@@ -176,18 +164,18 @@ def test_token_resolution_priority():
     resolved = config.resolve_targets()
 
     # Profile takes priority when specified
-    assert resolved[0].token == 'ghp_profile'
+    assert resolved[0].token == 'ghp_profile_token'
     # Legacy takes priority over env when no credential specified
     assert resolved[1].token == 'ghp_legacy'
 
-    del os.environ['GITHUB_TOKEN']
-
 
-def test_token_resolution_no_token():
+def test_token_resolution_no_token(monkeypatch, empty_credentials, download_config):
     """Test token resolution when no token available."""
+    monkeypatch.delenv('GITHUB_TOKEN', raising=False)
+
     config = AppConfig(
-        credentials=Credentials(),
-        download=DownloadConfig(),
+        credentials=empty_credentials,
+        download=download_config,
         targets=[
             Target(platform='github', username='user1')
         ]
@@ -196,3 +184,57 @@ def test_token_resolution_no_token():
     resolved = config.resolve_targets()
 
     assert resolved[0].token is None
+
+
+def test_resolve_targets_is_memoized(download_config):
+    """Test resolution runs once per config and callers get independent lists."""
+    config = AppConfig(
+        credentials=Credentials(github_token='ghp_token'),
+        download=download_config,
+        targets=[
+            Target(platform='github', username='user1')
+        ]
+    )
+
+    first = config.resolve_targets()
+    first.clear()
+    second = config.resolve_targets()
+
+    assert len(second) == 1
+    assert second[0] is config.resolved_targets[0]
+
+
+def test_resolve_targets_drops_duplicates(github_profile, download_config):
+    """Test a username listed twice with the same credentials resolves once."""
+    config = AppConfig(
+        credentials=Credentials(profiles={'my-github': github_profile}),
+        download=download_config,
+        targets={
+            'github': [
+                TargetGroup(credential='my-github', usernames=['user1', 'user2']),
+                TargetGroup(credential='my-github', usernames=['user1', 'user3']),
+            ]
+        }
+    )
+
+    resolved = config.resolve_targets()
+
+    assert [target.username for target in resolved] == ['user1', 'user2', 'user3']
+
+
+def test_resolve_targets_model_copy_resolves_again(monkeypatch, empty_credentials, download_config):
+    """Test a copy with updated targets or environment does not reuse the cached resolution."""
+    monkeypatch.setenv('GITHUB_TOKEN', 'ghp_first')
+    config = AppConfig(
+        credentials=empty_credentials,
+        download=download_config,
+        targets=[Target(platform='github', username='a')]
+    )
+    assert [(t.username, t.token) for t in config.resolve_targets()] == [('a', 'ghp_first')]
+
+    monkeypatch.setenv('GITHUB_TOKEN', 'ghp_second')
+    updated = config.model_copy(update={'targets': [Target(platform='github', username='b')]})
+    assert [(t.username, t.token) for t in updated.resolve_targets()] == [('b', 'ghp_second')]
+    assert [t.username for t in config.model_copy().resolve_targets()] == ['a']
+    # The original keeps its cached resolution
+    assert config.resolve_targets()[0].token == 'ghp_first'
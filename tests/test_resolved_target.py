@@ -7,7 +7,7 @@ from simple_repo_downloader.config import ResolvedTarget
 
 def test_resolved_target_creation():
     """Test creating a ResolvedTarget with all fields."""
-    resolved = ResolvedTarget(
+    resolved = ResolvedTarget.from_filters(
         platform='github',
         username='testuser',
         token='ghp_test123',
@@ -16,7 +16,8 @@ def test_resolved_target_creation():
     assert resolved.platform == 'github'
     assert resolved.username == 'testuser'
     assert resolved.token == 'ghp_test123'
-    assert resolved.filters == {'forks': False}
+    assert resolved.filters == (('forks', False),)
+    assert resolved.filters_dict == {'forks': False}
 
 
 def test_resolved_target_optional_token():
@@ -25,23 +26,24 @@ def test_resolved_target_optional_token():
         platform='gitlab',
         username='publicuser',
         token=None,
-        filters={}
+        filters=()
     )
     assert resolved.platform == 'gitlab'
     assert resolved.username == 'publicuser'
     assert resolved.token is None
-    assert resolved.filters == {}
+    assert resolved.filters == ()
 
 
 def test_resolved_target_empty_filters():
-    """Test creating a ResolvedTarget with empty filters dict."""
+    """Test creating a ResolvedTarget with no filters."""
     resolved = ResolvedTarget(
         platform='github',
         username='user',
         token='token123',
-        filters={}
+        filters=()
     )
-    assert resolved.filters == {}
+    assert resolved.filters == ()
+    assert resolved.filters_dict == {}
 
 
 def test_resolved_target_is_immutable():
@@ -50,8 +52,38 @@ def test_resolved_target_is_immutable():
         platform='github',
         username='testuser',
         token='token123',
-        filters={}
+        filters=()
     )
     # Attempt to modify should raise FrozenInstanceError
     with pytest.raises(FrozenInstanceError):
         resolved.platform = 'gitlab'
+
+
+def test_resolved_target_is_hashable():
+    """Test that targets with equal fields hash equal, whatever the filter order."""
+    first = ResolvedTarget.from_filters(
+        platform='github',
+        username='user',
+        token='token123',
+        filters={'forks': False, 'archived': False}
+    )
+    second = ResolvedTarget.from_filters(
+        platform='github',
+        username='user',
+        token='token123',
+        filters={'archived': False, 'forks': False}
+    )
+    assert first.filters == (('archived', False), ('forks', False))
+    assert first == second
+    assert len({first, second}) == 1
+
+
+def test_resolved_target_rejects_dict_filters():
+    """Test that dict filters must go through from_filters."""
+    with pytest.raises(TypeError, match="from_filters"):
+        ResolvedTarget(
+            platform='github',
+            username='user',
+            token=None,
+            filters={'forks': False}
+        )
@@ -1,8 +1,13 @@
 # tests/test_target_group.py
+import re
+
 import pytest
 from pydantic import ValidationError
 from simple_repo_downloader.config import TargetGroup
 
+USERNAMES_EMPTY = re.compile("Usernames cannot be empty")
+CREDENTIAL_EMPTY = re.compile("Credential name cannot be empty")
+
 
 def test_target_group_basic():
     """Test creating a basic target group."""
@@ -36,7 +41,7 @@ def test_target_group_empty_usernames_fails():
 
 def test_target_group_whitespace_username_fails():
     """Test that whitespace-only usernames are rejected."""
-    with pytest.raises(ValidationError, match="Usernames cannot be empty"):
+    with pytest.raises(ValidationError, match=USERNAMES_EMPTY):
         TargetGroup(
             credential='my-github',
             usernames=['user1', '  ', 'user2']
@@ -45,7 +50,7 @@ def test_target_group_whitespace_username_fails():
 
 def test_target_group_whitespace_credential_fails():
     """Test that whitespace-only credential is rejected."""
-    with pytest.raises(ValidationError, match="Credential name cannot be empty"):
+    with pytest.raises(ValidationError, match=CREDENTIAL_EMPTY):
         TargetGroup(
             credential='   ',
             usernames=['user1', 'user2']